@@ -0,0 +1,154 @@
+from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
+from typing import List, Literal, Optional, Tuple
+from datetime import date, timedelta
+
+
+# Allowed values for the small integer fields, matching their ge/le bounds
+_VALID_PASSENGERS = frozenset(range(1, 10))
+_VALID_MAX_STOPS = frozenset(range(0, 4))
+_VALID_FLEXIBILITY_DAYS = frozenset(range(0, 4))
+
+
+# type of trips
+TripType = Literal["one_way", "round_trip", "multi_city"]
+
+# type of passenger flying
+PassengerType = Literal["adult", "child", "infant"]
+
+# type of cabin class
+CabinClass = Literal["economy", "premium_economy", "business", "first"]
+
+
+class FlightQuery(BaseModel):
+    """Model for a users flight query"""
+
+    origin:Optional[str] = Field(None, description="The origin of the flight")
+    destination:Optional[str] = Field(None, description="The destination of the flight")
+
+
+    departure_date:Optional[date] = Field(None, description="The departure date of the flight in YYYY-MM-DD format, regex: ^\\d{4}-\\d{2}-\\d{2}$")
+
+    return_date:Optional[date] = Field(None, description="The return date of the flight in YYYY-MM-DD format, regex: ^\\d{4}-\\d{2}-\\d{2}$")
+
+    passengers:int = Field(default=1, description="The number of passengers flying", ge=1, le=9)
+    passenger_types:Tuple[PassengerType, ...] = Field(default=("adult",), description="The type of passengers flying")
+
+    budget:Optional[float] = Field(None, description="The budget for the flight in USD", ge=0)
+    currency:str =Field(default='USD', description="The currency of the budget")
+
+    trip_type:TripType = Field(default="one_way", description="The type of trip")
+
+    cabin_class:CabinClass = Field(default="economy", description="The cabin class of the flight")
+    max_stops:Optional[int] = Field(None, description="The maximum number of stops for the flight", ge=0, le=3)
+    preferred_airlines:List[str] = Field(default_factory=list, description="The preferred airlines for the flight")
+
+    flexible_dates:bool = Field(default=False, description="Whether the user is flexible with the dates of the flight")
+    date_flexibility_days:int = Field(default=0, description="The number of days the user is flexible with the dates of the flight", ge=0, le=3)
+
+
+    @field_validator('departure_date', 'return_date', mode='before')
+    @classmethod
+    def parse_dates(cls, v, info: ValidationInfo):
+        """parse YYYY-MM-DD strings once, so later checks work on date objects"""
+        if isinstance(v, str):
+            # fromisoformat also takes other ISO 8601 forms (20301201, 2030-W01-1)
+            if len(v) == 10 and v[4] == v[7] == '-':
+                try:
+                    return date.fromisoformat(v)
+                except ValueError:
+                    pass
+            label = info.field_name.replace('_', ' ').capitalize()
+            raise ValueError(f"{label} must be in YYYY-MM-DD format")
+        return v
+
+    @field_validator('departure_date')
+    @classmethod
+    def validate_departure_date(cls, v):
+        """validate the departure date"""
+        if v and v < date.today():
+            raise ValueError("Departure date cannot be in the past")
+        return v
+
+    @field_validator('origin', 'destination')
+    @classmethod
+    def validate_airport_codes(cls, v):
+        """validate the airport codes"""
+        if v:
+            v = v.strip().upper()
+            if len(v) == 3:
+                # after upper(), ascii letters are exactly [A-Z]
+                if not (v.isascii() and v.isalpha()):
+                    raise ValueError('airport code must be 3 letters')
+            elif len(v) < 2:
+                raise ValueError('city name must be at least 2 letters')
+        return v
+
+    @model_validator(mode='after')
+    def validate_trip_consistency(self):
+        """ross field validation for trip logic"""
+        return_date = self.return_date
+
+        # common one-way case: no return date, so only the trip type matters
+        if not return_date:
+            if self.trip_type == "round_trip":
+                raise ValueError('return date is required for multi-city trip')
+        elif self.departure_date and self.departure_date >= return_date:
+            raise ValueError('return date must be after departure date')
+
+        passengers = self.passengers
+        if len(self.passenger_types) != passengers:
+            self.passenger_types = ("adult",) * passengers
+
+        return self
+
+    @classmethod
+    def make_trusted(cls, **kwargs) -> "FlightQuery":
+        """
+        build a query from already-validated data without running validators.
+        only for internal callers; user input must go through the normal constructor.
+        date strings and passenger_types are still normalised the way the
+        validators would, since restored state often carries them in JSON form.
+        """
+        for key in ('departure_date', 'return_date'):
+            if isinstance(kwargs.get(key), str):
+                kwargs[key] = date.fromisoformat(kwargs[key])
+        query = cls.model_construct(**kwargs)
+        if len(query.passenger_types) != query.passengers:
+            query.passenger_types = ("adult",) * query.passengers
+        else:
+            query.passenger_types = tuple(query.passenger_types)
+        return query
+
+def create_sample_flight_query() -> FlightQuery:
+    """create a sample flight query"""
+    departure_date = date.today() + timedelta(days=30)
+    return FlightQuery.make_trusted(
+        origin="LAX",
+        destination="SFO",
+        departure_date=departure_date,
+        return_date=departure_date + timedelta(days=1),
+        passengers=1,
+        trip_type="round_trip",
+        budget=1000,
+    )
+
+def validate_query_completness(query:FlightQuery) -> List[str]:
+    """validate what is missing or out of range in the query"""
+    missing = []
+
+    if not query.origin:
+        missing.append('origin')
+    if not query.destination:
+        missing.append('destination')
+    if not query.departure_date:
+        missing.append('departure_date')
+
+    # queries built with make_trusted skip the model's range checks
+    if query.passengers not in _VALID_PASSENGERS:
+        missing.append('passengers')
+    if query.max_stops is not None and query.max_stops not in _VALID_MAX_STOPS:
+        missing.append('max_stops')
+    if query.date_flexibility_days not in _VALID_FLEXIBILITY_DAYS:
+        missing.append('date_flexibility_days')
+
+    return missing
@@ -0,0 +1,268 @@
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, field_validator, model_validator
+from typing import Annotated, List, Dict, Any, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import time
+
+from .query import CabinClass, FlightQuery
+
+
+# Below this many offers, one fused Python loop beats building a price list
+# for the builtins; measured crossover is between 200 and 500 offers
+_LOOP_STATS_MAX_FLIGHTS = 300
+
+# SearchResults fields derived from flights by calculate_statistics
+_STATISTICS_FIELDS = frozenset({"total_results", "min_price", "max_price", "average_price"})
+
+
+def _timestamp_to_iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+class Airport(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
+    iata_code: str = Field(..., description="The IATA code of the airport")
+    icao_code: Optional[str] = Field(None, description="4-letter ICAO code")
+    name: str = Field(..., description="Full airport name")
+    city: str = Field(..., description="City name")
+    country: str = Field(..., description="Country name")
+    country_code: str = Field(..., description="2-letter country code")
+    timezone: Optional[str] = Field(None, description="Airport timezone")
+
+    # Geographic coordinates
+    latitude: Optional[float] = Field(None, description="Latitude coordinate")
+    longitude: Optional[float] = Field(None, description="Longitude coordinate")
+
+    # Additional metadata
+    terminals: Optional[int] = Field(None, description="Number of terminals")
+    hub_airlines: Tuple[str, ...] = Field(default=(), description="Hub airlines")
+
+    @field_validator('iata_code')
+    @classmethod
+    def validate_iata_code(cls, v):
+        """validate the IATA code is formatted correctly"""
+        v = v.upper().strip()
+        if not (len(v) == 3 and v.isascii() and v.isalpha()):
+            raise ValueError('IATA code must be exactly 3 uppercase letters')
+        return v
+
+@dataclass(slots=True, frozen=True)
+class FlightSegment:
+    """
+    Individual flight journey segment.
+    Plain data: FlightOffer builds these from dicts once and then passes
+    the instances around without re-validating them.
+    """
+
+    # Flight identification
+    airline: Annotated[str, Field(description="Airline name or code")]
+    airline_code: Annotated[str, Field(description="2-letter airline code")]
+    flight_number: Annotated[str, Field(description="Flight number")]
+
+    # Route information
+    departure_airport: Annotated[str, Field(description="Departure airport IATA code")]
+    arrival_airport: Annotated[str, Field(description="Arrival airport IATA code")]
+
+    # Timing (ISO format for consistency)
+    departure_time: Annotated[str, Field(description="Departure time in ISO format")]
+    arrival_time: Annotated[str, Field(description="Arrival time in ISO format")]
+    duration: Annotated[str, Field(description="Flight duration (e.g., 'PT2H30M')")]
+
+    # Aircraft and service details
+    aircraft_type: Annotated[Optional[str], Field(description="Aircraft model")] = None
+    cabin_class: Annotated[CabinClass, Field(description="Cabin class")] = "economy"
+
+    # Operational details
+    stops: Annotated[int, Field(description="Number of stops", ge=0)] = 0
+    layover_airports: Tuple[str, ...] = ()
+    operating_airline: Annotated[Optional[str], Field(description="Operating airline if codeshare")] = None
+
+class FlightOffer(BaseModel):
+    """
+    Complete flight offer with pricing and segments.
+    This is what your search_flights tool will return.
+    """
+
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
+    # Unique identifier for this offer
+    offer_id: str = Field(..., description="Unique offer identifier")
+
+    # Pricing information
+    total_price: float = Field(..., description="Total price for all passengers")
+    price_per_passenger: float = Field(..., description="Price per passenger")
+    currency: str = Field("USD", description="Currency code")
+
+    # Price breakdown
+    base_fare: Optional[float] = Field(None, description="Base fare amount")
+    taxes: Optional[float] = Field(None, description="Tax amount")
+    fees: Optional[float] = Field(None, description="Additional fees")
+
+    # Flight segments (outbound + return if applicable)
+    outbound_segments: Tuple[FlightSegment, ...] = Field(..., description="Outbound flight segments")
+    return_segments: Tuple[FlightSegment, ...] = Field(default=(), description="Return flight segments")
+
+    # Booking information
+    booking_url: Optional[str] = Field(None, description="Direct booking URL")
+    booking_class: str = Field("ECONOMY", description="Booking class")
+    seats_available: Optional[int] = Field(None, description="Seats remaining")
+
+    # Additional metadata
+    is_refundable: bool = Field(False, description="Refund policy")
+    baggage_included: bool = Field(False, description="Baggage inclusion")
+    meal_service: bool = Field(False, description="Meal service available")
+
+    # Search metadata
+    search_timestamp: float = Field(default_factory=time.time, description="Unix timestamp of the search")
+    validity_period: Optional[str] = Field(None, description="How long this offer is valid")
+
+    @field_validator('offer_id')
+    @classmethod
+    def validate_offer_id(cls, v):
+        """Ensure offer ID is properly formatted"""
+        if not v or len(v.strip()) == 0:
+            raise ValueError('Offer ID cannot be empty')
+        return v.strip()
+
+    @model_validator(mode='after')
+    def validate_flight_logic(self):
+        """Validate flight offer consistency"""
+        outbound = self.outbound_segments
+
+        if not outbound:
+            raise ValueError('Flight offer must have at least one outbound segment')
+
+        # Validate pricing logic
+        total_price = self.total_price
+        price_per_passenger = self.price_per_passenger
+
+        if total_price > 0 and price_per_passenger > 0:
+            # Basic sanity check - total should be >= per passenger
+            if total_price < price_per_passenger:
+                raise ValueError('Total price cannot be less than price per passenger')
+
+        return self
+
+    @property
+    def search_timestamp_iso(self) -> str:
+        """search timestamp as an ISO 8601 string in UTC"""
+        return _timestamp_to_iso(self.search_timestamp)
+
+# Built once; validates a whole offer list in a single pydantic-core call
+_OFFERS_ADAPTER = TypeAdapter(List[FlightOffer])
+
+class SearchResults(BaseModel):
+    """
+    Container for flight search results with metadata.
+    This wraps the response from your flight search tool.
+    flights is a tuple; with_flights is the only way to narrow the results,
+    since model_copy would keep stale statistics.
+    """
+
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
+    # Core results
+    flights: Tuple[FlightOffer, ...] = Field(default=(), description="Found flight offers")
+    total_results: int = Field(0, description="Total number of flights found")
+
+    # Search context
+    search_id: str = Field(..., description="Unique search identifier")
+    query_parameters: FlightQuery = Field(..., description="Original search query")
+
+    # Metadata
+    search_timestamp: float = Field(default_factory=time.time, description="Unix timestamp of the search")
+    search_duration_ms: Optional[int] = Field(None, description="Search time in milliseconds")
+
+    # API information
+    api_provider: str = Field("amadeus", description="API provider used")
+    api_calls_made: int = Field(1, description="Number of API calls for this search")
+
+    # Result statistics
+    min_price: Optional[float] = Field(None, description="Lowest price found")
+    max_price: Optional[float] = Field(None, description="Highest price found")
+    average_price: Optional[float] = Field(None, description="Average price")
+
+    # Filtering applied
+    filters_applied: Dict[str, Any] = Field(default_factory=dict)
+    results_filtered_count: int = Field(0, description="Results removed by filtering")
+
+    @model_validator(mode='wrap')
+    @classmethod
+    def calculate_statistics(cls, data: Any, handler):
+        """Auto-calculate price statistics"""
+        if not isinstance(data, dict) or not data.get('flights'):
+            return handler(data)
+
+        # Validate the offers first so the statistics go in with the other
+        # fields; the model then keeps these FlightOffer instances as they are
+        try:
+            flights = _OFFERS_ADAPTER.validate_python(data['flights'])
+        except ValidationError as e:
+            raise ValidationError.from_exception_data(
+                cls.__name__,
+                [{**error, 'loc': ('flights', *error['loc'])} for error in e.errors(include_url=False)],
+            ) from None
+
+        if len(flights) >= _LOOP_STATS_MAX_FLIGHTS:
+            # min/max/sum run in C, which outpaces the loop on long lists
+            prices = [flight.total_price for flight in flights]
+            n = len(prices)
+            lo, hi, average = min(prices), max(prices), sum(prices) / n
+        else:
+            # Single pass for min, max and sum without building a price list
+            lo = hi = flights[0].total_price
+            total = 0.0
+            n = 0
+            for flight in flights:
+                price = flight.total_price
+                total += price
+                n += 1
+                if price < lo:
+                    lo = price
+                elif price > hi:
+                    hi = price
+            average = total / n
+
+        return handler({
+            **data,
+            'flights': flights,
+            'min_price': lo,
+            'max_price': hi,
+            'average_price': average,
+            'total_results': n,
+        })
+
+    def with_flights(self, flights: Sequence[FlightOffer], filters_applied: Optional[Dict[str, Any]] = None) -> "SearchResults":
+        """
+        Copy of these results holding only the given flights, with the
+        statistics recalculated and the removed offers counted as filtered.
+        """
+        data = {
+            name: getattr(self, name)
+            for name in type(self).model_fields
+            if name not in _STATISTICS_FIELDS
+        }
+        data['flights'] = tuple(flights)
+        data['results_filtered_count'] = self.results_filtered_count + max(0, len(self.flights) - len(data['flights']))
+        if filters_applied:
+            data['filters_applied'] = {**self.filters_applied, **filters_applied}
+        return type(self).model_validate(data)
+
+    # query_parameters is a mutable FlightQuery and filters_applied a dict,
+    # so results are declared unhashable rather than failing inside the generated hash
+    __hash__ = None
+
+    @property
+    def search_timestamp_iso(self) -> str:
+        """search timestamp as an ISO 8601 string in UTC"""
+        return _timestamp_to_iso(self.search_timestamp)
+
+def parse_flight_offers(raw: Union[str, bytes, List[Dict[str, Any]]]) -> List[FlightOffer]:
+    """
+    validate a batch of flight offers from the search API.
+    accepts the decoded list of offer dicts or the raw JSON payload.
+    """
+    if isinstance(raw, (str, bytes)):
+        return _OFFERS_ADAPTER.validate_json(raw)
+    return _OFFERS_ADAPTER.validate_python(raw)
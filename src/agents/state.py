@@ -1,36 +1,35 @@
-from typing import TypedDict, Annotated, Sequence, Optional, Dict, Any, List
+from dataclasses import dataclass, field
+from typing import Annotated, Sequence, Optional, Dict, Any, List
 from langchain_core.messages import BaseMessage
 import operator
 
 
-class AgentState(TypedDict):
+@dataclass(slots=True)
+class AgentState:
     """
     The state of an agent.
     """
-    messages: Annotated[Sequence[BaseMessage], operator.add]
-    flight_query: Dict[str, Any]
-    searcher_results: List[Dict[str, Any]]
-    processed_flights: List[Dict[str, Any]]
-    current_step: str
-    error_message: Optional[str]
-    has_error: bool
-    user_context: Dict[str, Any]
-    api_calls_made: int
-    search_metadata: Dict[str, Any]
+    messages: Annotated[Sequence[BaseMessage], operator.add] = field(default_factory=list)
+    flight_query: Dict[str, Any] = field(default_factory=dict)
+    searcher_results: List[Dict[str, Any]] = field(default_factory=list)
+    processed_flights: List[Dict[str, Any]] = field(default_factory=list)
+    current_step: str = "initial"
+    error_message: Optional[str] = None
+    has_error: bool = False
+    user_context: Dict[str, Any] = field(default_factory=dict)
+    api_calls_made: int = 0
+    search_metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def update(self, **kwargs: Any) -> None:
+        """
+        Set the given fields in place, for nodes that used dict-style updates.
+        """
+        for name, value in kwargs.items():
+            setattr(self, name, value)
 
 def create_initial_state(user_message:str) -> AgentState:
     """
     Initialize the agent state with the user message.
     """
-    return AgentState(
-        message=[],
-        flight_query={},
-        searcher_results=[],
-        processed_flights=[],
-        current_step="initial",
-        error_message=None,
-        has_error=False,
-        user_context={},
-        api_calls_made=0,
-        search_metadata={},
-    )
+    # the field defaults are the initial state; containers are fresh per call
+    return AgentState()
@@ -1,26 +1,67 @@
+import json
 import pytest
+import subprocess
 import sys
 import os
+from datetime import date, timedelta
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from agents.models import FlightQuery, TripType, Airport
+from agents.models import FlightQuery, Airport, FlightSegment, FlightOffer, SearchResults, create_sample_flight_query, validate_query_completness, parse_flight_offers
 
 def test_flight_query_validation():
-    valid_query = FlightQuery(origin="NYC", destination="LAX", departure_date="2025-12-01", return_date="2025-12-02", passengers=1, trip_type=TripType.ONE_WAY, budget=1000)
+    departure = date.today() + timedelta(days=30)
+    return_ = departure + timedelta(days=1)
+    valid_query = FlightQuery(origin="NYC", destination="LAX", departure_date=departure.isoformat(), return_date=return_.isoformat(), passengers=1, trip_type="one_way", budget=1000)
 
     assert valid_query.origin == "NYC"
+    assert valid_query.departure_date == departure
 
     with pytest.raises(ValueError, match="past"):
-        FlightQuery(origin="NYC", destination="LAX", departure_date="2024-01-01", return_date="2024-01-02", passengers=1, trip_type=TripType.ONE_WAY, budget=1000)
+        FlightQuery(origin="NYC", destination="LAX", departure_date="2024-01-01", return_date="2024-01-02", passengers=1, trip_type="one_way", budget=1000)
+
+    for bad_date in ("12/01/2030", "20301201", "2030-W01-1", "2030-13-01"):
+        with pytest.raises(ValueError, match="YYYY-MM-DD"):
+            FlightQuery(origin="NYC", destination="LAX", departure_date=bad_date)
+
+    with pytest.raises(ValueError, match="Return date must be in YYYY-MM-DD"):
+        FlightQuery(origin="NYC", destination="LAX", return_date="soon")
 
         # Test round trip validation
     with pytest.raises(ValueError, match="return date is required"):
         FlightQuery(
             origin="NYC",
             destination="LAX",
-            trip_type=TripType.ROUND_TRIP
+            trip_type="round_trip"
             # Missing return_date
         )
 
+    with pytest.raises(ValueError, match="return date must be after"):
+        FlightQuery(departure_date=return_.isoformat(), return_date=departure.isoformat())
+
+    # passenger types are still filled in when no dates are given
+    assert FlightQuery(passengers=2).passenger_types == ("adult", "adult")
+    assert FlightQuery(passenger_types=["adult", "child"], passengers=2).passenger_types == ("adult", "child")
+
+def test_create_sample_flight_query_is_valid():
+    sample = create_sample_flight_query()
+    assert sample.origin == "LAX"
+    assert sample.passenger_types == ("adult",)
+    assert FlightQuery(**sample.model_dump()) == sample
+
+def test_make_trusted_normalises_restored_state():
+    restored = create_sample_flight_query().model_dump(mode="json")
+    restored["passengers"] = 3
+    restored["passenger_types"] = ["adult"]
+
+    query = FlightQuery.make_trusted(**restored)
+    assert isinstance(query.departure_date, date)
+    assert query.passenger_types == ("adult", "adult", "adult")
+
+def test_validate_query_completness():
+    assert validate_query_completness(FlightQuery()) == ['origin', 'destination', 'departure_date']
+
+    trusted = FlightQuery.make_trusted(origin="JFK", destination="LAX", departure_date=date(2030, 1, 1), passengers=12, max_stops=5)
+    assert validate_query_completness(trusted) == ['passengers', 'max_stops']
+
 def test_airport_model():
     # Test IATA code validation
     airport = Airport(
@@ -32,8 +73,108 @@ def test_airport_model():
     )
     assert airport.iata_code == "LAX"
 
+    for bad_code in ("LA1", "LAXX", "LÄX"):
+        with pytest.raises(ValueError, match="3 uppercase letters"):
+            Airport(iata_code=bad_code, name="x", city="x", country="x", country_code="US")
+
+    # Output models are read-only and hashable
+    with pytest.raises(ValueError, match="frozen"):
+        airport.city = "Inglewood"
+    assert hash(airport) == hash(airport.model_copy())
+
 def test_flight_offer_validation():
     # Test with minimal required fields
+    offer = _make_offer("offer-1", 250.0)
+    assert isinstance(offer.outbound_segments[0], FlightSegment)
+
     # Test price validation
+    with pytest.raises(ValueError, match="less than price per passenger"):
+        FlightOffer(offer_id="offer-2", total_price=100.0, price_per_passenger=200.0, outbound_segments=offer.outbound_segments)
+
     # Test segment validation
-    pass
+    with pytest.raises(ValueError, match="at least one outbound segment"):
+        FlightOffer(offer_id="offer-3", total_price=100.0, price_per_passenger=100.0, outbound_segments=[])
+
+    # Segments are hashable and keep their field descriptions in the schema
+    assert hash(offer.outbound_segments[0]) == hash(FlightSegment(**_SEGMENT))
+    segment_schema = FlightOffer.model_json_schema()["$defs"]["FlightSegment"]
+    assert segment_schema["properties"]["airline"]["description"] == "Airline name or code"
+
+    # Segment instances are passed through as-is rather than rebuilt
+    reused = FlightOffer(offer_id="offer-4", total_price=250.0, price_per_passenger=250.0, outbound_segments=offer.outbound_segments)
+    assert reused.outbound_segments[0] is offer.outbound_segments[0]
+
+_SEGMENT = {
+    "airline": "American Airlines",
+    "airline_code": "AA",
+    "flight_number": "AA100",
+    "departure_airport": "JFK",
+    "arrival_airport": "LAX",
+    "departure_time": "2030-01-01T08:00:00",
+    "arrival_time": "2030-01-01T11:00:00",
+    "duration": "PT6H",
+}
+
+def _make_offer(offer_id, price):
+    return FlightOffer(offer_id=offer_id, total_price=price, price_per_passenger=price, outbound_segments=[_SEGMENT])
+
+def test_search_results_statistics():
+    results = SearchResults(
+        search_id="search-1",
+        query_parameters=FlightQuery(origin="JFK", destination="LAX"),
+        flights=[_make_offer("a", 300.0), _make_offer("b", 100.0), _make_offer("c", 200.0)],
+    )
+    assert results.min_price == 100.0
+    assert results.max_price == 300.0
+    assert results.average_price == 200.0
+    assert results.total_results == 3
+    assert results.search_timestamp_iso.endswith("+00:00")
+
+    # Large result sets go through the builtin min/max/sum path
+    many = SearchResults(
+        search_id="search-3",
+        query_parameters=FlightQuery(),
+        flights=[_make_offer(str(i), float(i + 1)) for i in range(500)],
+    )
+    assert many.min_price == 1.0
+    assert many.max_price == 500.0
+    assert many.average_price == 250.5
+    assert many.total_results == 500
+
+    # Narrowing the flights recalculates the statistics
+    filtered = results.with_flights(results.flights[1:], {"max_price": 250})
+    assert filtered.min_price == 100.0
+    assert filtered.max_price == 200.0
+    assert filtered.total_results == 2
+    assert filtered.results_filtered_count == 1
+    assert filtered.filters_applied == {"max_price": 250}
+
+    # flights can't be changed in place behind the statistics' back
+    assert isinstance(results.flights, tuple)
+    assert hash(results.flights[0]) == hash(results.flights[0].model_copy())
+
+    empty = SearchResults(search_id="search-2", query_parameters=FlightQuery())
+    assert empty.min_price is None
+    assert empty.total_results == 0
+
+def test_parse_flight_offers():
+    raw = [_make_offer(str(i), 100.0 + i).model_dump() for i in range(3)]
+
+    offers = parse_flight_offers(raw)
+    assert [offer.offer_id for offer in offers] == ["0", "1", "2"]
+    assert isinstance(offers[0].outbound_segments[0], FlightSegment)
+
+    assert parse_flight_offers(json.dumps(raw)) == offers
+
+    with pytest.raises(ValueError, match="at least one outbound segment"):
+        parse_flight_offers([{**raw[0], "outbound_segments": []}])
+
+def test_result_models_are_imported_lazily():
+    code = (
+        "import sys; import agents.models as models; "
+        "assert 'agents.results' not in sys.modules; "
+        "models.SearchResults; "
+        "assert 'agents.results' in sys.modules"
+    )
+    src_dir = os.path.join(os.path.dirname(__file__), '..')
+    subprocess.run([sys.executable, "-c", code], cwd=src_dir, check=True)
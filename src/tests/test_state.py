@@ -0,0 +1,27 @@
+import pytest
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from agents.state import AgentState, create_initial_state
+
+def test_create_initial_state():
+    state = create_initial_state("Find me a flight from NYC to LAX")
+
+    assert state.messages == []
+    assert state.current_step == "initial"
+    assert state.has_error is False
+    assert state.api_calls_made == 0
+
+    # Mutable defaults must not be shared between states
+    other = create_initial_state("Another request")
+    assert state.flight_query is not other.flight_query
+
+def test_agent_state_update():
+    state = AgentState()
+    state.update(current_step="searching", api_calls_made=1)
+
+    assert state.current_step == "searching"
+    assert state.api_calls_made == 1
+
+    with pytest.raises(AttributeError):
+        state.update(unknown_field=True)